@@ -1,6 +1,7 @@
 use anyhow::Error;
 use lucet_runtime_internals::module::DlModule;
 use lucetc::Lucetc;
+use std::fmt::Write;
 use std::sync::Arc;
 use tempfile::TempDir;
 
@@ -39,66 +40,77 @@ pub fn generate_test_wat(
     let num_locals = num_i32_locals / 2;
     assert!(num_locals > 2);
 
-    let mut module = "(module\n".to_string();
+    // Each local contributes a declaration and two `set_local` lines, together well under 192
+    // bytes; reserve that up front so large modules are built without repeated reallocation.
+    let mut module = String::with_capacity(192 * num_locals);
+    module.push_str("(module\n");
     for hostcall in hostcalls {
         // add an imported hostcall like
         // `(func $foo (import "env" "foo") (result i64))`
-        module.push_str(&format!(
+        write!(
+            module,
             "  (func ${} (import \"env\" \"{}\") (result i64))\n",
             hostcall, hostcall
-        ));
+        )
+        .unwrap();
     }
     module.push_str("  (func $localpalooza (export \"localpalooza\") (param i64) (result i64)\n");
 
     // Declare locals:
     module.push_str("(local ");
-    for _ in 0..num_locals {
-        module.push_str("i64 ");
-    }
+    module.push_str(&"i64 ".repeat(num_locals));
     module.push_str(")\n");
 
     // Use each local for the first time:
     for i in 1..num_locals {
-        module.push_str(&format!(
+        write!(
+            module,
             "(set_local {} (i64.add (get_local {}) (i64.xor (get_local {}) (i64.const {}))))\n",
             i,
             i - 1,
             i,
             i
-        ));
+        )
+        .unwrap();
     }
 
     // Use each local for a second time, so they get pushed to the stack between uses:
     for i in 2..(num_locals - 1) {
-        module.push_str(&format!(
+        write!(
+            module,
             "(set_local {} (i64.add (get_local {}) (i64.and (get_local {}) (i64.const {}))))\n",
             i,
             i - 1,
             i,
             i
-        ));
+        )
+        .unwrap();
     }
 
     // Keep locals alive across a recursive call. Make as many recursive calls as the first
     // argument to the func:
     module.push_str("(if (i32.wrap_i64 (get_local 0))\n");
-    module.push_str(&format!(
+    write!(
+        module,
         "  (then (set_local {} (i64.add (get_local {})\n",
         num_locals - 1,
         num_locals - 2
-    ));
+    )
+    .unwrap();
     if let Some(body) = recursive_body {
         module.push_str(body);
     }
     module.push_str("      (call $localpalooza (i64.sub (get_local 0) (i64.const 1))))))\n");
-    module.push_str(&format!(
+    write!(
+        module,
         "  (else (set_local {} (i64.add (get_local {}) (get_local {})))))\n",
         num_locals - 1,
         num_locals - 2,
         num_locals - 3
-    ));
+    )
+    .unwrap();
 
-    module.push_str(&format!("(get_local {})\n", num_locals - 1));
+    write!(module, "(get_local {})\n", num_locals - 1).unwrap();
     module.push_str("))\n");
     module
 }